@@ -4,8 +4,8 @@ The Column object in Cursor.description
 
 # Copyright (C) 2020 The Psycopg Team
 
-from typing import Any, NamedTuple, Optional, Sequence, TYPE_CHECKING
-from operator import attrgetter
+from typing import Any, Iterator, NamedTuple, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ._cursor_base import BaseCursor
@@ -17,6 +17,11 @@ class ColumnData(NamedTuple):
     fsize: int
 
 
+_ColumnRow = Tuple[
+    str, int, Optional[int], Optional[int], Optional[int], Optional[int], None
+]
+
+
 class Column(Sequence[Any]):
     __module__ = "psycopg"
 
@@ -38,12 +43,18 @@ class Column(Sequence[Any]):
         )
         self._type = cursor.adapters.types.get(self._data.ftype)
 
-    _attrs = tuple(
-        attrgetter(attr)
-        for attr in """
-            name type_code display_size internal_size precision scale null_ok
-            """.split()
-    )
+        # Materialize the DBAPI 7-items tuple once: the object is often
+        # accessed as a sequence (unpacked, iterated), so avoid computing
+        # the values on every access.
+        self._row: _ColumnRow = (
+            self._name,
+            self._data.ftype,
+            self._get_display_size(),
+            self._get_internal_size(),
+            self._get_precision(),
+            self._get_scale(),
+            None,
+        )
 
     def __repr__(self) -> str:
         return (
@@ -73,24 +84,47 @@ class Column(Sequence[Any]):
         return "".join(parts)
 
     def __getitem__(self, index: Any) -> Any:
-        if isinstance(index, slice):
-            return tuple(getter(self) for getter in self._attrs[index])
-        else:
-            return self._attrs[index](self)
+        return self._row[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._row)
 
     @property
     def name(self) -> str:
         """The name of the column."""
-        return self._name
+        return self._row[0]
 
     @property
     def type_code(self) -> int:
         """The numeric OID of the column."""
-        return self._data.ftype
+        return self._row[1]
 
     @property
     def display_size(self) -> Optional[int]:
         """The field size, for :sql:`varchar(n)`, None otherwise."""
+        return self._row[2]
+
+    @property
+    def internal_size(self) -> Optional[int]:
+        """The internal field size for fixed-size types, None otherwise."""
+        return self._row[3]
+
+    @property
+    def precision(self) -> Optional[int]:
+        """The number of digits for fixed precision types."""
+        return self._row[4]
+
+    @property
+    def scale(self) -> Optional[int]:
+        """The number of digits after the decimal point if available."""
+        return self._row[5]
+
+    @property
+    def null_ok(self) -> Optional[bool]:
+        """Always `!None`"""
+        return None
+
+    def _get_display_size(self) -> Optional[int]:
         if not self._type:
             return None
 
@@ -101,15 +135,11 @@ class Column(Sequence[Any]):
 
         return None
 
-    @property
-    def internal_size(self) -> Optional[int]:
-        """The internal field size for fixed-size types, None otherwise."""
+    def _get_internal_size(self) -> Optional[int]:
         fsize = self._data.fsize
         return fsize if fsize >= 0 else None
 
-    @property
-    def precision(self) -> Optional[int]:
-        """The number of digits for fixed precision types."""
+    def _get_precision(self) -> Optional[int]:
         if not self._type:
             return None
 
@@ -126,17 +156,10 @@ class Column(Sequence[Any]):
 
         return None
 
-    @property
-    def scale(self) -> Optional[int]:
-        """The number of digits after the decimal point if available."""
+    def _get_scale(self) -> Optional[int]:
         if self._type and self._type.name == "numeric":
             fmod = self._data.fmod - 4
             if fmod >= 0:
                 return fmod & 0xFFFF
 
         return None
-
-    @property
-    def null_ok(self) -> Optional[bool]:
-        """Always `!None`"""
-        return None
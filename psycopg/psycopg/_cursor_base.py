@@ -40,12 +40,18 @@ PIPELINE_ABORTED = pq.ExecStatus.PIPELINE_ABORTED
 
 ACTIVE = pq.TransactionStatus.ACTIVE
 
+# Result statuses accepted by _check_results()
+OK_STATUSES = frozenset((TUPLES_OK, COMMAND_OK, EMPTY_QUERY))
+
+# Max number of commands queued by executemany() before sending them
+EXECMANY_BATCH_SIZE = 64
+
 
 class BaseCursor(Generic[ConnectionType, Row]):
     __slots__ = """
         _conn format _adapters arraysize _closed _results pgresult _pos
         _iresult _rowcount _query _tx _last_query _row_factory _make_row
-        _pgconn _execmany_returning
+        _pgconn _execmany_returning _description _description_res
         __weakref__
         """.split()
 
@@ -75,6 +81,10 @@ class BaseCursor(Generic[ConnectionType, Row]):
         self._query: Optional[PostgresQuery]
         # None if executemany() not executing, True/False according to returning state
         self._execmany_returning: Optional[bool] = None
+        # The description is computed on first access and cached for the
+        # result it was computed for.
+        self._description: Optional[List[Column]] = None
+        self._description_res: Optional["PGresult"] = None
         if reset_query:
             self._query = None
 
@@ -111,6 +121,8 @@ class BaseCursor(Generic[ConnectionType, Row]):
         `!None` if the current resultset didn't return tuples.
         """
         res = self.pgresult
+        if res is self._description_res:
+            return self._description
 
         # We return columns if we have nfields, but also if we don't but
         # the query said we got tuples (mostly to handle the super useful
@@ -118,9 +130,11 @@ class BaseCursor(Generic[ConnectionType, Row]):
         if res and (
             res.nfields or res.status == TUPLES_OK or res.status == SINGLE_TUPLE
         ):
-            return [Column(self, i) for i in range(res.nfields)]
+            self._description = [Column(self, i) for i in range(res.nfields)]
         else:
-            return None
+            self._description = None
+        self._description_res = res
+        return self._description
 
     @property
     def rowcount(self) -> int:
@@ -225,7 +239,13 @@ class BaseCursor(Generic[ConnectionType, Row]):
                 pgq.dump(params)
 
             yield from self._maybe_prepare_gen(pgq, prepare=True)
-            yield from pipeline._communicate_gen()
+
+            # Let a few commands pile up in the queue before communicating
+            # with the server: it saves a wait cycle per command.
+            if len(pipeline.command_queue) >= EXECMANY_BATCH_SIZE:
+                yield from pipeline._communicate_gen()
+
+        yield from pipeline._communicate_gen()
 
         self._last_query = query
 
@@ -450,6 +470,32 @@ class BaseCursor(Generic[ConnectionType, Row]):
         pgq.convert(query, params)
         return pgq
 
+    def _load_iter_batch(
+        self, row0: int, row1: int, make_row: RowMaker[Row], bulk: bool
+    ) -> Tuple[List[Any], Optional[Exception]]:
+        """
+        Load the records between `!row0` and `!row1` to iterate on them.
+
+        Apply `!make_row` if `!bulk` is true, otherwise return the records
+        loaded as tuples. If a record fails to load, return the records
+        preceding it and the error, to raise after they have been consumed.
+        """
+        mr: RowMaker[Any] = make_row if bulk else tuple
+        try:
+            return self._tx.load_rows(row0, row1, mr), None
+        except Exception:
+            pass
+
+        # Load the records one at a time to find the failing one.
+        records = []
+        for row in range(row0, row1):
+            try:
+                records.append(self._tx.load_rows(row, row + 1, mr)[0])
+            except Exception as ex:
+                return records, ex
+
+        return records, None
+
     def _check_results(self, results: List["PGresult"]) -> None:
         """
         Verify that the results of a query are valid.
@@ -461,8 +507,7 @@ class BaseCursor(Generic[ConnectionType, Row]):
             raise e.InternalError("got no result from the query")
 
         for res in results:
-            status = res.status
-            if status != TUPLES_OK and status != COMMAND_OK and status != EMPTY_QUERY:
+            if res.status not in OK_STATUSES:
                 self._raise_for_result(res)
 
     def _raise_for_result(self, result: "PGresult") -> NoReturn:
@@ -17,7 +17,7 @@ from . import pq
 from . import abc
 from . import errors as e
 from .abc import Buffer, LoadFunc, AdaptContext, PyFormat, DumperKey, NoneType
-from .rows import Row, RowMaker
+from .rows import Row, RowMaker, _scalar_row_maker
 from ._oids import INVALID_OID, TEXT_OID
 from ._compat import TypeAlias
 from ._encodings import conn_encoding
@@ -51,7 +51,7 @@ class Transformer(AdaptContext):
     __slots__ = """
         types formats
         _conn _adapters _pgresult _dumpers _loaders _encoding _none_oid
-        _oid_dumpers _oid_types _row_dumpers _row_loaders
+        _oid_dumpers _oid_types _row_dumpers _row_loaders _field_indices
         """.split()
 
     types: Optional[Tuple[int, ...]]
@@ -96,6 +96,7 @@ class Transformer(AdaptContext):
         self._oid_types: Dict[int, bytes] = {}
 
         self._encoding = ""
+        self._field_indices: Tuple[int, ...] = ()
 
     @classmethod
     def from_context(cls, context: Optional[AdaptContext]) -> "Transformer":
@@ -138,12 +139,15 @@ class Transformer(AdaptContext):
 
         if not result:
             self._nfields = self._ntuples = 0
+            self._field_indices = ()
             if set_loaders:
                 self._row_loaders = []
             return
 
         self._ntuples = result.ntuples
         nf = self._nfields = result.nfields
+        # Iterated for every row loaded: create it once per result.
+        self._field_indices = tuple(range(nf))
 
         if not set_loaders:
             return
@@ -305,14 +309,25 @@ class Transformer(AdaptContext):
                 f"rows must be included between 0 and {self._ntuples}"
             )
 
-        records = []
-        for row in range(row0, row1):
-            record: List[Any] = [None] * self._nfields
-            for col in range(self._nfields):
-                val = res.get_value(row, col)
+        # Resolve everything used in the inner loop only once.
+        nfields = self._nfields
+        loaders = self._row_loaders
+        get_value = res.get_value
+        cols = self._field_indices
+        if make_row is _scalar_row_maker and nfields:
+            # scalar_row only returns the first column: don't load the others,
+            # consistently with the C implementation.
+            cols = (0,)
+
+        # The number of records is known: allocate the list only once.
+        records: List[Any] = [None] * (row1 - row0)
+        for i, row in enumerate(range(row0, row1)):
+            record: List[Any] = [None] * nfields
+            for col in cols:
+                val = get_value(row, col)
                 if val is not None:
-                    record[col] = self._row_loaders[col](val)
-            records.append(make_row(record))
+                    record[col] = loaders[col](val)
+            records[i] = make_row(record)
 
         return records
 
@@ -324,11 +339,19 @@ class Transformer(AdaptContext):
         if not 0 <= row < self._ntuples:
             return None
 
-        record: List[Any] = [None] * self._nfields
-        for col in range(self._nfields):
-            val = res.get_value(row, col)
+        nfields = self._nfields
+        loaders = self._row_loaders
+        get_value = res.get_value
+
+        cols = self._field_indices
+        if make_row is _scalar_row_maker and nfields:
+            cols = (0,)
+
+        record: List[Any] = [None] * nfields
+        for col in cols:
+            val = get_value(row, col)
             if val is not None:
-                record[col] = self._row_loaders[col](val)
+                record[col] = loaders[col](val)
 
         return make_row(record)
 
@@ -340,8 +363,10 @@ class Transformer(AdaptContext):
             )
 
         return tuple(
-            (self._row_loaders[i](val) if val is not None else None)
-            for i, val in enumerate(record)
+            [
+                (load(val) if val is not None else None)
+                for load, val in zip(self._row_loaders, record)
+            ]
         )
 
     def get_loader(self, oid: int, format: pq.Format) -> abc.Loader:
@@ -136,8 +136,9 @@ class PostgresQuery:
         """
         Verify the compatibility between a query and a set of params.
         """
-
-        if PostgresQuery.is_params_sequence(vars):
+        # Fast path for the most common types: this function is called for
+        # every record in executemany().
+        if isinstance(vars, (tuple, list)) or PostgresQuery.is_params_sequence(vars):
             if len(vars) != len(parts) - 1:
                 raise e.ProgrammingError(
                     f"the query has {len(parts) - 1} placeholders but"
@@ -273,6 +273,11 @@ class TypesRegistry:
 
         Unlike `__getitem__`, return None if not found.
         """
+        # Fast path for the lookup by oid, performed for every result column
+        # and by the adapters. It also avoids raising and catching a KeyError
+        # for unknown oids (e.g. user-defined types).
+        if isinstance(key, int):
+            return self._registry.get(key)
         try:
             return self[key]
         except KeyError:
@@ -14,11 +14,12 @@ from typing import Any, Iterator, Iterable, List, Optional, Type
 from typing import TYPE_CHECKING, overload
 from contextlib import contextmanager
 
+
 from . import pq
 from . import errors as e
 from .abc import Query, Params
 from .copy import Copy, Writer
-from .rows import Row, RowMaker, RowFactory
+from .rows import Row, RowMaker, RowFactory, _scalar_row_maker
 from ._compat import Self
 from ._pipeline import Pipeline
 from ._cursor_base import BaseCursor
@@ -28,6 +29,9 @@ if TYPE_CHECKING:
 
 ACTIVE = pq.TransactionStatus.ACTIVE
 
+# Number of records loaded at once when iterating on a cursor
+ITER_BATCH_SIZE = 100
+
 
 class Cursor(BaseCursor["Connection[Any]", Row]):
     __module__ = "psycopg"
@@ -225,15 +229,33 @@ class Cursor(BaseCursor["Connection[Any]", Row]):
         self._fetch_pipeline()
         self._check_result_for_fetch()
 
-        def load(pos: int) -> Optional[Row]:
-            return self._tx.load_row(pos, self._make_row)
-
         while True:
-            row = load(self._pos)
-            if row is None:
+            res = self.pgresult
+            if not res or self._pos >= res.ntuples:
                 break
-            self._pos += 1
-            yield row
+
+            # Load the records in batches, which is cheaper than loading them
+            # one at a time. Unless it's one the Transformer can apply in bulk,
+            # apply the row factory only when a record is yielded, so that it
+            # is called once per record and fails on the right record.
+            make_row = self._make_row
+            bulk = make_row is tuple or make_row is _scalar_row_maker
+            pos = self._pos
+            records, error = self._load_iter_batch(
+                pos, min(pos + ITER_BATCH_SIZE, res.ntuples), make_row, bulk
+            )
+            for record in records:
+                row = record if bulk else make_row(record)
+                pos += 1
+                self._pos = pos
+                yield row
+                if self._pos != pos:
+                    # The cursor was moved while iterating. What we loaded
+                    # is not what comes next anymore.
+                    break
+
+            if error and self._pos == pos:
+                raise error
 
     def scroll(self, value: int, mode: str = "relative") -> None:
         """
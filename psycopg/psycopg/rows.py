@@ -5,6 +5,7 @@ psycopg row factories
 # Copyright (C) 2021 The Psycopg Team
 
 import functools
+from operator import itemgetter
 from typing import Any, Callable, Dict, List, Optional, NamedTuple, NoReturn
 from typing import TYPE_CHECKING, Protocol, Sequence, Tuple, Type
 from collections import namedtuple
@@ -223,10 +224,12 @@ def scalar_row(cursor: "BaseCursor[Any, Any]") -> "RowMaker[Any]":
     if nfields < 1:
         raise e.ProgrammingError("at least one column expected")
 
-    def scalar_row_(values: Sequence[Any]) -> Any:
-        return values[0]
+    # Implementation detail: make sure this is the object itself, not an
+    # equivalent function, because the C code fast-paths on it.
+    return _scalar_row_maker
+
 
-    return scalar_row_
+_scalar_row_maker: "RowMaker[Any]" = itemgetter(0)
 
 
 def no_result(values: Sequence[Any]) -> NoReturn:
@@ -5,7 +5,7 @@ psycopg server-side cursor objects.
 # Copyright (C) 2020 The Psycopg Team
 
 from typing import Any, AsyncIterator, List, Iterable, Iterator
-from typing import Optional, TYPE_CHECKING, overload
+from typing import Optional, Tuple, TYPE_CHECKING, overload
 from warnings import warn
 
 from . import pq
@@ -38,7 +38,10 @@ INTRANS = pq.TransactionStatus.INTRANS
 class ServerCursorMixin(BaseCursor[ConnectionType, Row]):
     """Mixin to add ServerCursor behaviour and implementation a BaseCursor."""
 
-    __slots__ = "_name _scrollable _withhold _described itersize _format".split()
+    __slots__ = """
+        _name _scrollable _withhold _described itersize maxprefetch _format
+        _fetch_cmd
+        """.split()
 
     def __init__(
         self,
@@ -51,7 +54,10 @@ class ServerCursorMixin(BaseCursor[ConnectionType, Row]):
         self._withhold = withhold
         self._described = False
         self.itersize: int = DEFAULT_ITERSIZE
+        self.maxprefetch: Optional[int] = None
         self._format = TEXT
+        # Number of records and FETCH statement of the last fetch.
+        self._fetch_cmd: Optional[Tuple[Optional[int], bytes]] = None
 
     def __repr__(self) -> str:
         # Insert the name as the second word
@@ -132,6 +138,7 @@ class ServerCursorMixin(BaseCursor[ConnectionType, Row]):
         self._results = results
         self._select_current_result(0, format=self._format)
         self._described = True
+        self._fetch_cmd = None
 
     def _close_gen(self) -> PQGen[None]:
         ts = self._conn.pgconn.transaction_status
@@ -167,11 +174,17 @@ class ServerCursorMixin(BaseCursor[ConnectionType, Row]):
             yield from self._start_query()
             yield from self._describe_gen()
 
-        query = sql.SQL("FETCH FORWARD {} FROM {}").format(
-            sql.SQL("ALL") if num is None else sql.Literal(num),
-            sql.Identifier(self._name),
-        )
-        res = yield from self._conn._exec_command(query, result_format=self._format)
+        # Iterating or fetching repeatedly usually fetches the same number
+        # of records: avoid composing the same statement every time.
+        cmd = self._fetch_cmd
+        if cmd is None or cmd[0] != num:
+            query = sql.SQL("FETCH FORWARD {} FROM {}").format(
+                sql.SQL("ALL") if num is None else sql.Literal(num),
+                sql.Identifier(self._name),
+            )
+            cmd = self._fetch_cmd = (num, query.as_bytes(self._conn))
+
+        res = yield from self._conn._exec_command(cmd[1], result_format=self._format)
         # pipeline mode otherwise, unsupported here.
         assert res is not None
 
@@ -189,6 +202,15 @@ class ServerCursorMixin(BaseCursor[ConnectionType, Row]):
         )
         yield from self._conn._exec_command(query)
 
+    def _next_itersize(self, size: int) -> int:
+        """Return the number of records to fetch in the next batch iterating."""
+        if self.maxprefetch is None:
+            # Not growing: honour itersize if changed while iterating.
+            return self.itersize
+        if size >= self.maxprefetch:
+            return size
+        return min(size * 2, self.maxprefetch)
+
     def _make_declare_statement(self, query: Query) -> sql.Composed:
         if isinstance(query, bytes):
             query = query.decode(self._encoding)
@@ -328,14 +350,16 @@ class ServerCursor(ServerCursorMixin["Connection[Any]", Row], Cursor[Row]):
         return recs
 
     def __iter__(self) -> Iterator[Row]:
+        size = self.itersize
         while True:
             with self._conn.lock:
-                recs = self._conn.wait(self._fetch_gen(self.itersize))
+                recs = self._conn.wait(self._fetch_gen(size))
             for rec in recs:
                 self._pos += 1
                 yield rec
-            if len(recs) < self.itersize:
+            if len(recs) < size:
                 break
+            size = self._next_itersize(size)
 
     def scroll(self, value: int, mode: str = "relative") -> None:
         with self._conn.lock:
@@ -460,14 +484,16 @@ class AsyncServerCursor(
         return recs
 
     async def __aiter__(self) -> AsyncIterator[Row]:
+        size = self.itersize
         while True:
             async with self._conn.lock:
-                recs = await self._conn.wait(self._fetch_gen(self.itersize))
+                recs = await self._conn.wait(self._fetch_gen(size))
             for rec in recs:
                 self._pos += 1
                 yield rec
-            if len(recs) < self.itersize:
+            if len(recs) < size:
                 break
+            size = self._next_itersize(size)
 
     async def scroll(self, value: int, mode: str = "relative") -> None:
         async with self._conn.lock:
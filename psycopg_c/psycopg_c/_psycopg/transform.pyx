@@ -23,7 +23,7 @@ from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from psycopg import errors as e
 from psycopg.pq import Format as PqFormat
-from psycopg.rows import Row, RowMaker
+from psycopg.rows import Row, RowMaker, _scalar_row_maker
 from psycopg._encodings import conn_encoding
 
 NoneType = type(None)
@@ -432,6 +432,9 @@ cdef class Transformer:
                 f"rows must be included between 0 and {self._ntuples}"
             )
 
+        if make_row is _scalar_row_maker and self._nfields:
+            return self._load_scalars(row0, row1)
+
         cdef libpq.PGresult *res = self._pgresult._pgresult_ptr
         # cheeky access to the internal PGresult structure
         cdef pg_result_int *ires = <pg_result_int*>res
@@ -500,6 +503,9 @@ cdef class Transformer:
         if not 0 <= row < self._ntuples:
             return None
 
+        if make_row is _scalar_row_maker and self._nfields:
+            return self._load_value(row, 0)
+
         cdef libpq.PGresult *res = self._pgresult._pgresult_ptr
         # cheeky access to the internal PGresult structure
         cdef pg_result_int *ires = <pg_result_int*>res
@@ -537,6 +543,35 @@ cdef class Transformer:
                 make_row, <PyObject *>record, NULL)
         return record
 
+    cdef list _load_scalars(self, int row0, int row1):
+        # Fast path for scalar_row: load the first column only, without
+        # creating a record for each row.
+        cdef int row
+        cdef list records = PyList_New(row1 - row0)
+        for row in range(row0, row1):
+            pyval = self._load_value(row, 0)
+            Py_INCREF(pyval)
+            PyList_SET_ITEM(records, row - row0, pyval)
+        return records
+
+    cdef object _load_value(self, int row, int col):
+        # cheeky access to the internal PGresult structure
+        cdef pg_result_int *ires = <pg_result_int*>self._pgresult._pgresult_ptr
+        cdef PGresAttValue *attval = &(ires.tuples[row][col])
+        if attval.len == -1:  # NULL_LEN
+            return None
+
+        cdef PyObject *loader = PyList_GET_ITEM(self._row_loaders, col)
+        if (<RowLoader>loader).cloader is not None:
+            return (<RowLoader>loader).cloader.cload(attval.value, attval.len)
+
+        b = PyMemoryView_FromObject(
+            ViewBuffer._from_buffer(
+                self._pgresult,
+                <unsigned char *>attval.value, attval.len))
+        return PyObject_CallFunctionObjArgs(
+            (<RowLoader>loader).loadfunc, <PyObject *>b, NULL)
+
     cpdef object load_sequence(self, record: Sequence[Optional[Buffer]]):
         cdef Py_ssize_t nfields = len(record)
         out = PyTuple_New(nfields)
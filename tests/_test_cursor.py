@@ -3,6 +3,7 @@ Support module for test_cursor[_async].py
 """
 
 import re
+from functools import lru_cache
 from typing import Any, List, Match, Union
 
 import pytest
@@ -35,6 +36,11 @@ def ph(cur: Any, query: str) -> str:
     if "%(" in query:
         pytest.skip("RawCursor only supports positional placeholders")
 
+    return _raw_placeholders(query)
+
+
+@lru_cache(maxsize=1024)
+def _raw_placeholders(query: str) -> str:
     n = 1
 
     def s(m: Match[str]) -> str:
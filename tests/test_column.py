@@ -62,6 +62,30 @@ def test_description_slice(conn):
     curs.description[0][0:2] == ("a", 23)
 
 
+def test_description_unpack(conn):
+    curs = conn.cursor()
+    curs.execute("select 'x'::varchar(10) as a")
+    (col,) = curs.description
+    name, type_code, dsize, isize, prec, scale, null_ok = col
+    assert (name, type_code) == ("a", builtins["varchar"].oid)
+    assert (dsize, isize, prec, scale, null_ok) == (10, None, None, None, None)
+    assert tuple(col) == tuple(col[i] for i in range(len(col)))
+
+
+def test_description_cached(conn):
+    curs = conn.cursor()
+    curs.execute("select 1::int as a")
+    desc = curs.description
+    assert curs.description is desc
+
+    curs.execute("select 1::int as a, 2::int as b")
+    assert curs.description is not desc
+    assert [c.name for c in curs.description] == ["a", "b"]
+
+    curs.execute("set timezone to 'UTC'")
+    assert curs.description is None
+
+
 @pytest.mark.parametrize(
     "type, precision, scale, dsize, isize",
     [
@@ -328,6 +328,19 @@ def test_query_badenc(conn, encoding):
         cur.execute("select '€'")
 
 
+@pytest.mark.crdb_skip("encoding")
+def test_query_encode_same_query(conn):
+    # The cursor reuses its Transformer executing the same query again, but
+    # the query must be encoded with the current connection encoding.
+    cur = conn.cursor()
+    query = ph(cur, "select %s::int, octet_length('€')")
+    cur.execute(query, (1,))
+    assert cur.fetchone() == (1, 3)
+    conn.execute("set client_encoding to latin9")
+    cur.execute(query, (2,))
+    assert cur.fetchone() == (2, 3)
+
+
 def test_executemany(conn, execmany):
     cur = conn.cursor()
     cur.executemany(
@@ -545,6 +558,111 @@ def test_iter_stop(conn):
     assert list(cur) == []
 
 
+def test_iter_many(conn):
+    cur = conn.cursor()
+    cur.execute("select generate_series(1, 1000)")
+    assert list(cur) == [(i,) for i in range(1, 1001)]
+    assert cur.rownumber == 1000
+
+
+def test_iter_fetch_scroll(conn):
+    cur = conn.cursor()
+    cur.execute("select generate_series(0, 999)")
+    got = []
+    for (rec,) in cur:
+        got.append(rec)
+        assert cur.rownumber == rec + 1
+        if rec == 10:
+            assert cur.fetchone() == (11,)
+        elif rec == 20:
+            cur.scroll(500, "absolute")
+        elif rec == 510:
+            break
+
+    assert got == list(range(11)) + list(range(12, 21)) + list(range(500, 511))
+
+
+def test_iter_row_error(conn):
+    calls = []
+
+    def failing_row(cur):
+
+        def failing_row_(values):
+            calls.append(values[0])
+            if values[0] == 50:
+                raise ValueError("bad row")
+            return values[0]
+
+        return failing_row_
+
+    cur = conn.cursor(row_factory=failing_row)
+    cur.execute("select generate_series(0, 199)")
+    got = []
+    with pytest.raises(ValueError):
+        for rec in cur:
+            got.append(rec)
+
+    assert got == list(range(50))
+    assert cur.rownumber == 50
+    assert calls == list(range(51))
+
+
+def test_iter_row_none_error(conn):
+    calls = []
+
+    def failing_row(cur):
+
+        def failing_row_(values):
+            calls.append(values[0])
+            if values[0] == 4:
+                raise ValueError("bad row")
+            return None if values[0] == 2 else values[0]
+
+        return failing_row_
+
+    cur = conn.cursor(row_factory=failing_row)
+    cur.execute("select generate_series(1, 6)")
+    got = []
+    with pytest.raises(ValueError):
+        for rec in cur:
+            got.append(rec)
+
+    assert got == [1, None, 3]
+    assert cur.rownumber == 3
+    assert calls == [1, 2, 3, 4]
+
+
+def test_iter_load_error(conn):
+
+    class BadLoader(psycopg.adapt.Loader):
+
+        def load(self, data):
+            if data == b"bad":
+                raise ValueError("bad value")
+            return bytes(data).decode()
+
+    cur = conn.cursor()
+    cur.adapters.register_loader("text", BadLoader)
+    cur.execute(
+        """select x, case when x = 50 then 'bad' else 'ok' end
+        from generate_series(0, 199) as x"""
+    )
+    got = []
+    with pytest.raises(ValueError):
+        for rec in cur:
+            got.append(rec)
+
+    assert got == [(i, "ok") for i in range(50)]
+    assert cur.rownumber == 50
+
+
+def test_iter_none_rows(conn):
+    cur = conn.cursor(row_factory=rows.scalar_row)
+    cur.execute("select nullif(x, 3) from generate_series(1, 5) as x")
+    assert list(cur) == [1, 2, None, 4, 5]
+    assert cur.rownumber == 5
+
+
 def test_row_factory(conn):
     cur = conn.cursor(row_factory=my_row_factory)
 
@@ -328,6 +328,19 @@ async def test_query_badenc(aconn, encoding):
         await cur.execute("select '\u20ac'")
 
 
+@pytest.mark.crdb_skip("encoding")
+async def test_query_encode_same_query(aconn):
+    # The cursor reuses its Transformer executing the same query again, but
+    # the query must be encoded with the current connection encoding.
+    cur = aconn.cursor()
+    query = ph(cur, "select %s::int, octet_length('\u20ac')")
+    await cur.execute(query, (1,))
+    assert (await cur.fetchone()) == (1, 3)
+    await aconn.execute("set client_encoding to latin9")
+    await cur.execute(query, (2,))
+    assert (await cur.fetchone()) == (2, 3)
+
+
 async def test_executemany(aconn, execmany):
     cur = aconn.cursor()
     await cur.executemany(
@@ -549,6 +562,107 @@ async def test_iter_stop(aconn):
     assert (await alist(cur)) == []
 
 
+async def test_iter_many(aconn):
+    cur = aconn.cursor()
+    await cur.execute("select generate_series(1, 1000)")
+    assert await alist(cur) == [(i,) for i in range(1, 1001)]
+    assert cur.rownumber == 1000
+
+
+async def test_iter_fetch_scroll(aconn):
+    cur = aconn.cursor()
+    await cur.execute("select generate_series(0, 999)")
+    got = []
+    async for (rec,) in cur:
+        got.append(rec)
+        assert cur.rownumber == rec + 1
+        if rec == 10:
+            assert (await cur.fetchone()) == (11,)
+        elif rec == 20:
+            await cur.scroll(500, "absolute")
+        elif rec == 510:
+            break
+
+    assert got == list(range(11)) + list(range(12, 21)) + list(range(500, 511))
+
+
+async def test_iter_row_error(aconn):
+    calls = []
+
+    def failing_row(cur):
+        def failing_row_(values):
+            calls.append(values[0])
+            if values[0] == 50:
+                raise ValueError("bad row")
+            return values[0]
+
+        return failing_row_
+
+    cur = aconn.cursor(row_factory=failing_row)
+    await cur.execute("select generate_series(0, 199)")
+    got = []
+    with pytest.raises(ValueError):
+        async for rec in cur:
+            got.append(rec)
+
+    assert got == list(range(50))
+    assert cur.rownumber == 50
+    assert calls == list(range(51))
+
+
+async def test_iter_row_none_error(aconn):
+    calls = []
+
+    def failing_row(cur):
+        def failing_row_(values):
+            calls.append(values[0])
+            if values[0] == 4:
+                raise ValueError("bad row")
+            return None if values[0] == 2 else values[0]
+
+        return failing_row_
+
+    cur = aconn.cursor(row_factory=failing_row)
+    await cur.execute("select generate_series(1, 6)")
+    got = []
+    with pytest.raises(ValueError):
+        async for rec in cur:
+            got.append(rec)
+
+    assert got == [1, None, 3]
+    assert cur.rownumber == 3
+    assert calls == [1, 2, 3, 4]
+
+
+async def test_iter_load_error(aconn):
+    class BadLoader(psycopg.adapt.Loader):
+        def load(self, data):
+            if data == b"bad":
+                raise ValueError("bad value")
+            return bytes(data).decode()
+
+    cur = aconn.cursor()
+    cur.adapters.register_loader("text", BadLoader)
+    await cur.execute(
+        """select x, case when x = 50 then 'bad' else 'ok' end
+        from generate_series(0, 199) as x"""
+    )
+    got = []
+    with pytest.raises(ValueError):
+        async for rec in cur:
+            got.append(rec)
+
+    assert got == [(i, "ok") for i in range(50)]
+    assert cur.rownumber == 50
+
+
+async def test_iter_none_rows(aconn):
+    cur = aconn.cursor(row_factory=rows.scalar_row)
+    await cur.execute("select nullif(x, 3) from generate_series(1, 5) as x")
+    assert await alist(cur) == [1, 2, None, 4, 5]
+    assert cur.rownumber == 5
+
+
 async def test_row_factory(aconn):
     cur = aconn.cursor(row_factory=my_row_factory)
 
@@ -433,6 +433,50 @@ def test_itersize(conn, commands):
             assert "fetch forward 2" in cmd.lower()
 
 
+def test_maxprefetch(conn, commands):
+    with conn.cursor("foo") as cur:
+        assert cur.maxprefetch is None
+        cur.itersize = 2
+        cur.maxprefetch = 10
+        cur.execute("select generate_series(1, %s) as bar", (30,))
+        commands.popall()  # flush begin and other noise
+
+        assert list(cur) == [(i,) for i in range(1, 31)]
+        cmds = commands.popall()
+        sizes = [int(cmd.lower().split()[2]) for cmd in cmds]
+        assert sizes == [2, 4, 8, 10, 10]
+
+
+def test_itersize_change(conn, commands):
+    with conn.cursor("foo") as cur:
+        cur.itersize = 2
+        cur.execute("select generate_series(1, %s) as bar", (10,))
+        commands.popall()  # flush begin and other noise
+
+        for (rec,) in cur:
+            if rec == 2:
+                cur.itersize = 5
+        cmds = commands.popall()
+        sizes = [int(cmd.lower().split()[2]) for cmd in cmds]
+        assert sizes == [2, 5, 5]
+
+
+def test_fetch_commands(conn, commands):
+    with conn.cursor("foo") as cur:
+        cur.execute("select generate_series(1, %s) as bar", (10,))
+        commands.popall()  # flush begin and other noise
+
+        assert cur.fetchone() == (1,)
+        assert cur.fetchone() == (2,)
+        assert cur.fetchmany(3) == [(3,), (4,), (5,)]
+        assert cur.fetchone() == (6,)
+        assert cur.fetchall() == [(7,), (8,), (9,), (10,)]
+        cmds = [cmd.lower() for cmd in commands.popall()]
+        sizes = [cmd.split()[2] for cmd in cmds]
+        assert sizes == ["1", "1", "3", "1", "all"]
+        assert all((cmd.endswith('from "foo"') for cmd in cmds))
+
+
 def test_cant_scroll_by_default(conn):
     cur = conn.cursor("tmp")
     assert cur.scrollable is None
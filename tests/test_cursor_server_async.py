@@ -440,6 +440,50 @@ async def test_itersize(aconn, acommands):
             assert "fetch forward 2" in cmd.lower()
 
 
+async def test_maxprefetch(aconn, acommands):
+    async with aconn.cursor("foo") as cur:
+        assert cur.maxprefetch is None
+        cur.itersize = 2
+        cur.maxprefetch = 10
+        await cur.execute("select generate_series(1, %s) as bar", (30,))
+        acommands.popall()  # flush begin and other noise
+
+        assert await alist(cur) == [(i,) for i in range(1, 31)]
+        cmds = acommands.popall()
+        sizes = [int(cmd.lower().split()[2]) for cmd in cmds]
+        assert sizes == [2, 4, 8, 10, 10]
+
+
+async def test_itersize_change(aconn, acommands):
+    async with aconn.cursor("foo") as cur:
+        cur.itersize = 2
+        await cur.execute("select generate_series(1, %s) as bar", (10,))
+        acommands.popall()  # flush begin and other noise
+
+        async for (rec,) in cur:
+            if rec == 2:
+                cur.itersize = 5
+        cmds = acommands.popall()
+        sizes = [int(cmd.lower().split()[2]) for cmd in cmds]
+        assert sizes == [2, 5, 5]
+
+
+async def test_fetch_commands(aconn, acommands):
+    async with aconn.cursor("foo") as cur:
+        await cur.execute("select generate_series(1, %s) as bar", (10,))
+        acommands.popall()  # flush begin and other noise
+
+        assert await cur.fetchone() == (1,)
+        assert await cur.fetchone() == (2,)
+        assert await cur.fetchmany(3) == [(3,), (4,), (5,)]
+        assert await cur.fetchone() == (6,)
+        assert await cur.fetchall() == [(7,), (8,), (9,), (10,)]
+        cmds = [cmd.lower() for cmd in acommands.popall()]
+        sizes = [cmd.split()[2] for cmd in cmds]
+        assert sizes == ["1", "1", "3", "1", "all"]
+        assert all(cmd.endswith('from "foo"') for cmd in cmds)
+
+
 async def test_cant_scroll_by_default(aconn):
     cur = aconn.cursor("tmp")
     assert cur.scrollable is None
@@ -359,6 +359,33 @@ def test_executemany_no_returning(conn):
         assert cur.nextset() is None
 
 
+def test_executemany_many_rows(conn):
+    conn.set_autocommit(True)
+    conn.execute("drop table if exists execmanybatch")
+    conn.execute(
+        "create unlogged table execmanybatch (id serial primary key, num integer)"
+    )
+    nrows = 200  # more than the commands queued before communicating
+    with conn.pipeline(), conn.cursor() as cur:
+        cur.executemany(
+            "insert into execmanybatch(num) values (%s) returning num",
+            [(i,) for i in range(nrows)],
+            returning=True,
+        )
+        got = []
+        while True:
+            got.extend(cur.fetchall())
+            if not cur.nextset():
+                break
+        assert got == [(i,) for i in range(nrows)]
+
+        cur.executemany(
+            "insert into execmanybatch(num) values (%s)", [(i,) for i in range(nrows)]
+        )
+        cur.execute("select count(*) from execmanybatch")
+        assert cur.fetchone() == (nrows * 2,)
+
+
 @pytest.mark.crdb("skip", reason="temp tables")
 def test_executemany_trace(conn, trace):
     conn.set_autocommit(True)
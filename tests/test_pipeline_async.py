@@ -356,6 +356,34 @@ async def test_executemany_no_returning(aconn):
         assert cur.nextset() is None
 
 
+async def test_executemany_many_rows(aconn):
+    await aconn.set_autocommit(True)
+    await aconn.execute("drop table if exists execmanybatch")
+    await aconn.execute(
+        "create unlogged table execmanybatch (id serial primary key, num integer)"
+    )
+    nrows = 200  # more than the commands queued before communicating
+    async with aconn.pipeline(), aconn.cursor() as cur:
+        await cur.executemany(
+            "insert into execmanybatch(num) values (%s) returning num",
+            [(i,) for i in range(nrows)],
+            returning=True,
+        )
+        got = []
+        while True:
+            got.extend(await cur.fetchall())
+            if not cur.nextset():
+                break
+        assert got == [(i,) for i in range(nrows)]
+
+        await cur.executemany(
+            "insert into execmanybatch(num) values (%s)",
+            [(i,) for i in range(nrows)],
+        )
+        await cur.execute("select count(*) from execmanybatch")
+        assert await cur.fetchone() == (nrows * 2,)
+
+
 @pytest.mark.crdb("skip", reason="temp tables")
 async def test_executemany_trace(aconn, trace):
     await aconn.set_autocommit(True)
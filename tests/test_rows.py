@@ -2,6 +2,7 @@ import pytest
 
 import psycopg
 from psycopg import rows
+from psycopg.adapt import Loader
 
 from .utils import eur
 
@@ -112,6 +113,34 @@ def test_scalar_row(conn):
         cur.execute("select")
 
 
+def test_scalar_row_many(conn):
+    cur = conn.cursor(row_factory=rows.scalar_row)
+    cur.execute("select nullif(x, 3), -x from generate_series(1, 5) as x")
+    assert cur.fetchone() == 1
+    assert cur.fetchmany(2) == [2, None]
+    assert cur.fetchall() == [4, 5]
+
+    cur.execute("select x from generate_series(1, 5) as x")
+    assert list(cur) == [1, 2, 3, 4, 5]
+
+
+def test_scalar_row_skip_columns(conn):
+    class BadLoader(Loader):
+        def load(self, data):
+            raise ValueError("bad value")
+
+    # Only the first column is loaded, so the other ones can't fail.
+    cur = conn.cursor(row_factory=rows.scalar_row)
+    cur.adapters.register_loader("text", BadLoader)
+    cur.execute("select x, 'x'::text from generate_series(1, 3) as x")
+    assert cur.fetchone() == 1
+    assert cur.fetchall() == [2, 3]
+
+    cur.execute("select 'x'::text, 1")
+    with pytest.raises(ValueError):
+        cur.fetchone()
+
+
 @pytest.mark.parametrize(
     "factory",
     "tuple_row dict_row namedtuple_row class_row args_row kwargs_row".split(),